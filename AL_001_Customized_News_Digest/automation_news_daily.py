@@ -1,20 +1,98 @@
 # Automation News Digest - Daily Email Script
 
-import feedparser
+try:
+    # lxml-based parser, much faster than feedparser on large feeds
+    import fastfeedparser as feedparser
+except ImportError:
+    import feedparser
 import pandas as pd
 from datetime import datetime
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import heapq
 import time
-import random
 import re
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+from urllib.parse import urlsplit
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.utils import parsedate_to_datetime
+
+try:
+    # C implementation of Aho-Corasick, finds all keywords in a single pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Matches HTML tags; [^>]* avoids the backtracking of a lazy .*?
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# Matches the "Generated on" line of the digest HTML
+_GEN_RE = re.compile(r'<p>Generated on .*?</p>')
+
+# Shared HTTP session - keeps connections alive between API calls and retries
+# rate-limited or overloaded requests with backoff. Only statuses where the server
+# did no work are retried, and read=0 keeps a POST the server already accepted
+# from being sent twice (which could bill a generation twice)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=1.0,
+        status_forcelist=[429, 503, 529],
+        allowed_methods=['GET', 'POST'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+# (connect, read) timeout in seconds for Claude API requests
+_API_TIMEOUT = (10, 60)
+
+def _build_keyword_matcher(keywords):
+    """
+    Build a matcher that finds any of the (lowercased) keywords in a lowercased text with a single scan.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, and a compiled
+    regex alternation of the keywords otherwise.
+    
+    Returns:
+        The automaton or compiled pattern, or None if there are no keywords
+    """
+    if not keywords:
+        return None
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+def _contains_keyword(text, matcher):
+    """Check if the matcher finds any keyword in the (already lowercased) text."""
+    if matcher is None:
+        return False
+    if isinstance(matcher, re.Pattern):
+        return matcher.search(text) is not None
+    # Stop at the first match instead of collecting all of them
+    return next(matcher.iter(text), None) is not None
 
 class RSSAutomationNewsDigest:
-    def __init__(self, keywords=None, max_results=100, debug_mode=False):
+    # Common English words used for simple language detection
+    _EN_MARKERS = frozenset(['the', 'and', 'is', 'in', 'to', 'of', 'for', 'a', 'with', 'that'])
+    
+    def __init__(self, keywords=None, max_results=100, debug_mode=False, cache_file='feed_cache.json'):
         """
         Initialize the RSS-based Automation News Digest with keywords to filter news.
         
@@ -22,6 +100,8 @@ class RSSAutomationNewsDigest:
             keywords (list): List of keywords to filter news. If None, default keywords will be used.
             max_results (int): Maximum number of results to return (default: 20)
             debug_mode (bool): Enable extra debug output
+            cache_file (str): JSON file used to keep feed entries between runs, so unchanged
+                feeds are not downloaded and parsed again. If None, caching is disabled.
         """
         # Default keywords related to automation
         self.default_keywords = [
@@ -47,6 +127,10 @@ class RSSAutomationNewsDigest:
         self.max_results = max_results
         self.debug_mode = debug_mode
         
+        # Lowercase the keywords once and match all of them in one scan of each entry
+        self._kw_lower = tuple(keyword.lower() for keyword in self.keywords)
+        self._kw_matcher = _build_keyword_matcher(self._kw_lower)
+        
         # Digital and workflow automation-focused RSS feeds
         self.rss_feeds = [
             # General tech sites (kept from original)
@@ -70,6 +154,16 @@ class RSSAutomationNewsDigest:
         ]
         
         self.news_items = []
+        
+        # Load the entries and ETag/Last-Modified values cached by the previous run
+        self.cache_file = cache_file
+        self._feed_cache = {}
+        if self.cache_file and os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self._feed_cache = json.load(f)
+            except Exception as e:
+                print(f"Could not load feed cache {self.cache_file}: {str(e)}")
     
     def _is_related_to_automation(self, title, description=""):
         """
@@ -90,40 +184,91 @@ class RSSAutomationNewsDigest:
             print(f"Checking title: {title}")
         
         # Simple language detection - check for common English words
-        english_markers = ['the', 'and', 'is', 'in', 'to', 'of', 'for', 'a', 'with', 'that']
-        english_word_count = sum(1 for word in english_markers if f" {word} " in f" {text_to_check} ")
-        
         # Consider it English if it contains at least 2 common English words
-        is_english = english_word_count >= 2
+        found_markers = set()
+        for token in text_to_check.split():
+            if token in self._EN_MARKERS:
+                found_markers.add(token)
+                if len(found_markers) >= 2:
+                    break
+        is_english = len(found_markers) >= 2
+        
+        # No need to scan for keywords if it isn't English
+        if not is_english:
+            if self.debug_mode:
+                print(f"  Skipping non-English content: {title}")
+            return False
         
         # Check if it's automation-related
-        is_automation_related = any(keyword.lower() in text_to_check for keyword in self.keywords)
+        return _contains_keyword(text_to_check, self._kw_matcher)
+
+    async def _afetch(self, session, feed):
+        """
+        Download an RSS feed and parse the returned content.
+        
+        Args:
+            session (aiohttp.ClientSession): Shared session used for all feeds
+            feed (dict): Dictionary containing feed name and URL
+            
+        Returns:
+            tuple: (parsed feed, ETag, Last-Modified), or (None, None, None) if the
+                feed has not changed since it was cached
+        """
+        if self.debug_mode:
+            print(f"\nFetching feed: {feed['name']} ({feed['url']})")
+        
+        # Ask the server to skip the download if the cached copy is still current
+        headers = {}
+        cached = self._feed_cache.get(feed['url'])
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('modified'):
+                headers['If-Modified-Since'] = cached['modified']
+        
+        async with session.get(feed['url'], headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status == 304:
+                if self.debug_mode:
+                    print(f"  {feed['name']} not modified, using cached entries")
+                return None, None, None
+            
+            response.raise_for_status()
+            data = await response.read()
+            etag = response.headers.get('ETag')
+            modified = response.headers.get('Last-Modified')
         
-        if self.debug_mode and not is_english:
-            print(f"  Skipping non-English content: {title}")
+        return feedparser.parse(data), etag, modified
+    
+    async def _fetch_all(self):
+        """
+        Download and parse all RSS feeds concurrently on a single event loop.
         
-        return is_automation_related and is_english
-
-    def fetch_feed(self, feed):
+        Returns:
+            list: One _afetch result (or the raised exception) per entry in self.rss_feeds
+        """
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=4)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *[self._afetch(session, feed) for feed in self.rss_feeds],
+                return_exceptions=True
+            )
+    
+    def _extract_entries(self, feed, parsed_feed):
         """
-        Fetch and parse an RSS feed.
+        Extract the title, URL, description and date of each entry in a parsed RSS feed.
         
         Args:
             feed (dict): Dictionary containing feed name and URL
+            parsed_feed: The parsed feed returned by feedparser
             
         Returns:
-            tuple: (list of relevant news items, number of entries checked)
+            tuple: (list of entries with a title and URL, number of entries checked).
+                The date is None for entries without one.
         """
-        feed_items = []
+        entries = []
         entries_count = 0
         
         try:
-            if self.debug_mode:
-                print(f"\nFetching feed: {feed['name']} ({feed['url']})")
-                
-            # Parse the feed
-            parsed_feed = feedparser.parse(feed['url'])
-            
             # Track number of entries checked
             entries_count = len(parsed_feed.entries)
             
@@ -132,63 +277,64 @@ class RSSAutomationNewsDigest:
             
             # Process each entry
             for entry in parsed_feed.entries:
-                title = entry.title
+                # Entries are dict subclasses, so use plain dict lookups
+                title = entry.get('title', '')
                 
                 # Get URL (link)
-                url = entry.link if hasattr(entry, 'link') else ""
+                url = entry.get('link', '')
+                
+                if not title or not url:
+                    continue
                 
                 # Get description (summary or content)
-                description = ""
-                if hasattr(entry, 'summary'):
-                    description = entry.summary
-                elif hasattr(entry, 'description'):
-                    description = entry.description
-                elif hasattr(entry, 'content') and len(entry.content) > 0:
-                    description = entry.content[0].value
+                description = entry.get('summary') or entry.get('description') or ''
+                if not description and entry.get('content'):
+                    description = entry['content'][0].get('value', '')
                 
                 # Get publication date
-                pub_date = datetime.now().strftime('%Y-%m-%d')  # Default to today
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                pub_date = None  # Filled in with today's date by fetch_news
+                if entry.get('published_parsed'):
                     try:
-                        pub_date = time.strftime('%Y-%m-%d', entry.published_parsed)
+                        pub_date = time.strftime('%Y-%m-%d', entry['published_parsed'])
                     except:
                         pass
-                elif hasattr(entry, 'pubDate'):
+                elif entry.get('published'):
                     try:
-                        # Try to parse the date string
-                        parsed_date = pd.to_datetime(entry.pubDate)
-                        pub_date = parsed_date.strftime('%Y-%m-%d')
-                    except:
-                        pass
+                        # fastfeedparser normalizes dates to ISO 8601 strings
+                        pub_date = datetime.fromisoformat(entry['published']).strftime('%Y-%m-%d')
+                    except ValueError:
+                        try:
+                            # feedparser keeps the raw RSS (RFC 822) date when it can't parse it
+                            pub_date = parsedate_to_datetime(entry['published']).strftime('%Y-%m-%d')
+                        except:
+                            pass
                 
-                # Check if related to automation
-                if title and url and self._is_related_to_automation(title, description):
-                    # Clean up description (remove HTML tags)
-                    clean_description = re.sub(r'<.*?>', '', description)
-                    # Truncate to a reasonable length
-                    truncated_description = clean_description[:200] + '...' if len(clean_description) > 200 else clean_description
-                    
-                    feed_items.append({
-                        'title': title,
-                        'url': url,
-                        'description': truncated_description,
-                        'source': feed['name'],
-                        'date': pub_date
-                    })
-                    
-                    if self.debug_mode:
-                        print(f"  Added: {title}")
-            
-            if self.debug_mode:
-                print(f"  Found {len(feed_items)} automation-related items in this feed")
+                entries.append({
+                    'title': title,
+                    'url': url,
+                    'description': description,
+                    'source': feed['name'],
+                    'date': pub_date
+                })
                 
-            return feed_items, entries_count
+            return entries, entries_count
             
         except Exception as e:
             if self.debug_mode:
-                print(f"  Error fetching feed {feed['name']}: {str(e)}")
+                print(f"  Error processing feed {feed['name']}: {str(e)}")
             raise e  # Re-raise the exception to be caught in fetch_news
     
+    def _to_news_item(self, entry):
+        """Turn an extracted entry into a news item with a cleaned, truncated description."""
+        description = entry['description']
+        # Clean up description (remove HTML tags)
+        # Plain-text summaries have no '<' and skip the regex entirely
+        clean_description = _TAG_RE.sub('', description) if '<' in description else description
+        # Truncate to a reasonable length
+        truncated_description = clean_description[:200] + '...' if len(clean_description) > 200 else clean_description
+        
+        return {**entry, 'description': truncated_description}
+    
     def fetch_news(self):
         """Fetch news from all RSS feeds and filter for automation-related content."""
         if self.debug_mode:
@@ -201,13 +347,67 @@ class RSSAutomationNewsDigest:
         
         print(f"Starting to fetch news from {total_feeds} RSS feeds...")
         
-        # Process each feed
-        for feed_index, feed in enumerate(self.rss_feeds):
+        # Download all feeds concurrently - total time is bounded by the
+        # slowest feed rather than the sum of all of them
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running (plain script) - run one here
+            results = asyncio.run(self._fetch_all())
+        else:
+            # An event loop is already running (e.g. Jupyter), so asyncio.run
+            # can't be used on this thread - run it on a worker thread instead
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results = executor.submit(asyncio.run, self._fetch_all()).result()
+        
+        # Fallback date for entries without one, computed once for the whole run
+        today = datetime.now().strftime('%Y-%m-%d')
+        
+        # Filter the downloaded feeds
+        for feed_index, (feed, result) in enumerate(zip(self.rss_feeds, results)):
             print(f"Processing feed {feed_index+1}/{total_feeds}: {feed['name']}")
             try:
-                feed_items, entries_count = self.fetch_feed(feed)
+                if isinstance(result, BaseException):
+                    raise result
+                
+                parsed_feed, etag, modified = result
+                if parsed_feed is None:
+                    # Not modified since the last run - reuse the cached entries
+                    cached = self._feed_cache[feed['url']]
+                    entries, entries_count = cached['entries'], cached['entries_count']
+                else:
+                    entries, entries_count = self._extract_entries(feed, parsed_feed)
+                    # Only feeds that send ETag/Last-Modified can be revalidated later
+                    if etag or modified:
+                        self._feed_cache[feed['url']] = {
+                            'etag': etag,
+                            'modified': modified,
+                            'entries': entries,
+                            'entries_count': entries_count
+                        }
+                    else:
+                        self._feed_cache.pop(feed['url'], None)
+                
+                # Use the current feed name (it may have changed since the entries
+                # were cached) and date undated entries as today
+                entries = [
+                    {**entry, 'source': feed['name'], 'date': entry['date'] or today}
+                    for entry in entries
+                ]
+                
                 total_entries_checked += entries_count
                 
+                feed_items = []
+                for entry in entries:
+                    if self._is_related_to_automation(entry['title'], entry['description']):
+                        feed_items.append(self._to_news_item(entry))
+                        
+                        if self.debug_mode:
+                            print(f"  Added: {entry['title']}")
+                
+                if self.debug_mode:
+                    print(f"  Found {len(feed_items)} automation-related items in this feed")
+                
                 if feed_items:
                     self.news_items.extend(feed_items)
                     print(f"✓ Successfully processed {feed['name']} - Found {len(feed_items)} relevant articles from {entries_count} entries")
@@ -215,20 +415,39 @@ class RSSAutomationNewsDigest:
                 else:
                     print(f"✓ Processed {feed['name']} - No relevant articles found among {entries_count} entries")
                     successful_feeds += 1
-                    
-                # Be nice to servers
-                time.sleep(random.uniform(0.5, 1.5))
                 
             except Exception as e:
                 print(f"✗ Failed to process {feed['name']}: {str(e)}")
                 failed_feeds += 1
         
-        # Sort by date (newest first)
-        self.news_items.sort(key=lambda x: x['date'], reverse=True)
+        # Save the cache for the next run, dropping feeds that are no longer configured
+        if self.cache_file:
+            self._feed_cache = {
+                feed['url']: self._feed_cache[feed['url']]
+                for feed in self.rss_feeds
+                if feed['url'] in self._feed_cache
+            }
+            try:
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._feed_cache, f)
+            except Exception as e:
+                print(f"Could not save feed cache {self.cache_file}: {str(e)}")
         
-        # Limit to max_results
-        if len(self.news_items) > self.max_results:
-            self.news_items = self.news_items[:self.max_results]
+        # Drop articles that appear in more than one feed, comparing URLs
+        # without their query string and fragment
+        seen_urls = set()
+        unique_items = []
+        for item in self.news_items:
+            url_key = urlsplit(item['url'])._replace(query='', fragment='').geturl()
+            if url_key in seen_urls:
+                continue
+            seen_urls.add(url_key)
+            unique_items.append(item)
+        self.news_items = unique_items
+        
+        # Keep the newest max_results items, sorted by date (newest first).
+        # Dates are YYYY-MM-DD strings, so they compare chronologically
+        self.news_items = heapq.nlargest(self.max_results, self.news_items, key=lambda x: x['date'])
         
         print("\n=== SUMMARY ===")
         print(f"Total feeds processed: {total_feeds}")
@@ -244,10 +463,12 @@ class RSSAutomationNewsDigest:
         if not additional_keywords:
             return self.news_items
             
+        matcher = _build_keyword_matcher([keyword.lower() for keyword in additional_keywords])
+        
         filtered_items = []
         for item in self.news_items:
             text_to_check = (item['title'] + " " + item['description']).lower()
-            if any(keyword.lower() in text_to_check for keyword in additional_keywords):
+            if _contains_keyword(text_to_check, matcher):
                 filtered_items.append(item)
                 
         # Limit to max_results
@@ -284,8 +505,11 @@ class RSSAutomationNewsDigest:
         # Create full path including folder
         full_path = os.path.join(folder_path, filename)
         
-        df = pd.DataFrame(self.news_items)
-        df.to_csv(full_path, index=False)
+        # Stream the rows with the csv module - no need to build a DataFrame
+        with open(full_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['title', 'url', 'description', 'source', 'date'])
+            writer.writeheader()
+            writer.writerows(self.news_items)
         print(f"Saved {len(self.news_items)} news items to {full_path}")
     
         
@@ -303,38 +527,38 @@ class RSSAutomationNewsDigest:
             sources[source].append(item)
             
         # Create HTML content
-        html_content = f"""
+        html_parts = [f"""
         <div style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px;">
             <h1 style="color: #333;">Automation News Digest</h1>
             <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-        """
+        """]
         
         for source, items in sources.items():
-            html_content += f"""
+            html_parts.append(f"""
             <div style="margin-bottom: 30px;">
                 <h2 style="color: #0066cc; margin-top: 30px; border-bottom: 1px solid #ddd; padding-bottom: 10px;">{source}</h2>
                 <ul style="list-style-type: none; padding: 0;">
-            """
+            """)
             
             for item in items:
-                html_content += f"""
+                html_parts.append(f"""
                 <li style="margin-bottom: 15px;">
                     <a href="{item['url']}" target="_blank" style="color: #0066cc; text-decoration: none; font-weight: bold;">{item['title']}</a>
                     <div style="color: #333; margin: 5px 0;">{item['description']}</div>
                     <div style="color: #666; font-size: 0.8em;">{item['date']}</div>
                 </li>
-                """
+                """)
                 
-            html_content += """
+            html_parts.append("""
                 </ul>
             </div>
-            """
+            """)
             
-        html_content += """
+        html_parts.append("""
         </div>
-        """
+        """)
         
-        return html_content
+        return ''.join(html_parts)
 
     def save_to_html(self, filename=None):
         """
@@ -369,10 +593,13 @@ class RSSAutomationNewsDigest:
             
         print(f"Saved HTML digest to {full_path}")
 
-def get_claude_summary():
+def get_claude_summary(news_items):
     """
     Uses Claude API to generate a summary of the automation news
     Requires a file named 'user_api_key.txt' with your Anthropic API key
+    
+    Args:
+        news_items (list): News items from RSSAutomationNewsDigest.fetch_news()
     """
     # Check if API key file exists
     if not os.path.exists('user_api_key.txt'):
@@ -383,30 +610,27 @@ def get_claude_summary():
     with open('user_api_key.txt', 'r') as f:
         api_key = f.read().strip()
     
-    # Generate the filename with today's date
-    today_date = datetime.now().strftime('%Y-%m-%d')
-    html_file = f'C:\\Users\\Masu_Dev\\Documents\\automation_library\\Project_001_Customized_News_Digest\\automation_news_folder\\automation_news_{today_date}.html'
-        
-    # Check if HTML file exists
-    if not os.path.exists(html_file):
-        print(f"Error: {html_file} not found. Please run the digest.save_to_html() cell first.")
+    if not news_items:
+        print("Error: No news items to summarize. Please run digest.fetch_news() first.")
         return None
-        
-    # Read HTML content
-    with open(html_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    
+    # List the news items as plain text - far fewer tokens than the HTML digest
+    news_content = '\n'.join(
+        f"- {item['title']} ({item['source']}, {item['date']}): {item['description']}"
+        for item in news_items
+    )
     
     # Prepare the prompt
     prompt = f"""
-    Here is an HTML file containing today's automation news digest.
+    Here is a list of today's automation news items.
     Please provide a concise, straightforward summary of the key trends 
     and important developments in automation technology from this digest.
     Focus on the most significant news items, avoiding unnecessary words or fluff.
     Limit your response to 3-5 key points that someone interested in automation technology should know.
     Return in bullet list format and avoid naming the article.
     
-    HTML Content:
-    {html_content}
+    News Items:
+    {news_content}
     """
     
     # Make API request to Claude
@@ -424,10 +648,11 @@ def get_claude_summary():
     }
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.anthropic.com/v1/messages",
             headers=headers,
-            json=data
+            json=data,
+            timeout=_API_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -511,7 +736,7 @@ def send_news_digest_email(digest_obj, claude_summary=None):
     msg['To'] = email_config['recipient']
     
     # Create the HTML email content
-    html_content = f"""
+    html_parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -532,37 +757,38 @@ def send_news_digest_email(digest_obj, claude_summary=None):
         
         <div class="summary">
             <h3>🤖 Today's AI Summary</h3>
-    """
+    """]
     
     # Add Claude summary if available
     if claude_summary:
-        html_content += f"{claude_summary.replace('•', '<br>•').replace('*', '<br>*')}"
+        html_parts.append(f"{claude_summary.replace('•', '<br>•').replace('*', '<br>*')}")
     else:
-        html_content += "<p>AI summary not available for today.</p>"
+        html_parts.append("<p>AI summary not available for today.</p>")
     
-    html_content += """
+    html_parts.append("""
         </div>
         
         <div class="digest">
             <h3>Today's Automation News</h3>
-    """
+    """)
     
     # Add the HTML digest content
     digest_html = digest_obj.generate_html()
     # Remove the header part (we've already added our own)
     digest_html = digest_html.split('<h1 style="color: #333;">Automation News Digest</h1>', 1)[-1]
     # Remove the date line if present
-    digest_html = re.sub(r'<p>Generated on .*?</p>', '', digest_html)
+    if 'Generated on' in digest_html:
+        digest_html = _GEN_RE.sub('', digest_html)
     
-    html_content += digest_html
-    html_content += """
+    html_parts.append(digest_html)
+    html_parts.append("""
         </div>
     </body>
     </html>
-    """
+    """)
     
     # Attach parts to email
-    msg.attach(MIMEText(html_content, 'html'))
+    msg.attach(MIMEText(''.join(html_parts), 'html'))
     
     # Send email
     try:
@@ -592,18 +818,21 @@ def send_daily_digest():
         print("Fetching news...")
         digest.fetch_news()
         
-        # 3. Save HTML and CSV outputs
+        # 3. Save HTML and CSV outputs and 4. generate Claude summary
         today_date = datetime.now().strftime('%Y-%m-%d')
         html_file = f'automation_news_{today_date}.html'
         csv_file = f'automation_news_{today_date}.csv'
         
-        print("Saving digest files...")
-        digest.save_to_html(html_file)
-        digest.save_to_csv(csv_file)
-        
-        # 4. Generate Claude summary
-        print("Generating AI summary...")
-        claude_summary = get_claude_summary()
+        # The file writes run while waiting on the (much slower) API request
+        print("Saving digest files and generating AI summary...")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            html_future = executor.submit(digest.save_to_html, html_file)
+            csv_future = executor.submit(digest.save_to_csv, csv_file)
+            summary_future = executor.submit(get_claude_summary, digest.news_items)
+            
+            html_future.result()
+            csv_future.result()
+            claude_summary = summary_future.result()
         
         if claude_summary:
             # Save summary to file